@@ -8,6 +8,7 @@ import datetime
 import pytz
 import random
 import requests
+import asyncio
 from discord.ext import tasks
 
 # --- 設定項目 ---
@@ -16,6 +17,9 @@ GUILD_IDS = [int(id_str) for id_str in os.getenv("GUILD_IDS", "").split(',') if
 SPREADSHEET_NAME = "グラナドエスパダM 党員所持リスト"
 INFO_SPREADSHEET_NAME = os.getenv("INFO_SPREADSHEET_NAME", "グラナドエスパダM_BOT用DB") # .envから読み込む
 TARGET_CHANNEL_ID = int(os.getenv("TARGET_CHANNEL_ID", 0))
+LIVE_BOARD_ENABLED = os.getenv("LIVE_BOARD_ENABLED", "false").lower() == "true" # TARGET_CHANNEL_IDにライブボードを設置する
+LIVE_BOARD_DEBOUNCE_SECONDS = int(os.getenv("LIVE_BOARD_DEBOUNCE_SECONDS", 10)) # 最後の更新からこの秒数だけ待ってまとめて反映する
+LIVE_BOARD_MAX_WAIT_SECONDS = int(os.getenv("LIVE_BOARD_MAX_WAIT_SECONDS", 60)) # 更新が続いても最初の更新からこの秒数で必ず反映する
 # ----------------
 
 
@@ -71,6 +75,7 @@ PREFECTURE_CODES = {
 
 
 MODAL_GROUP_SIZE = 5
+CHECKLIST_ITEMS_PER_PAGE = 10 # 1ページあたりのキャラクター数
 bot = discord.Bot()
 
 def create_checklist_embed(paged_data, current_page, total_pages):
@@ -107,6 +112,15 @@ def create_checklist_embed(paged_data, current_page, total_pages):
 
     return embed
 
+def group_items_by_character(all_items):
+    """シートの行をキャラクター名ごとにまとめる"""
+    grouped_data = {}
+    for item in all_items:
+        char_name = item.get('キャラクター名', '不明')
+        if char_name not in grouped_data: grouped_data[char_name] = []
+        grouped_data[char_name].append(item)
+    return grouped_data
+
 # --- UIクラス ---
 class AddItemModal(Modal):
     def __init__(self, category: str, author_name: str):
@@ -133,6 +147,7 @@ class AddItemModal(Modal):
                 worksheet.append_row([self.category, new_level, self.author_name])
                 response_message = f"`{self.category}` をレベル `{new_level}` で追加しました。"
             
+            request_live_board_refresh()
             await interaction.response.send_message(response_message, ephemeral=True)
         except Exception as e:
             await interaction.response.send_message(f"更新中にエラーが発生: {e}", ephemeral=True)
@@ -173,6 +188,7 @@ class BulkUpdateModal(Modal):
                     updated_count += 1
             if batch_update_requests: worksheet.batch_update(batch_update_requests)
             if new_rows: worksheet.append_rows(new_rows)
+            if updated_count > 0: request_live_board_refresh()
             response_message = f"{updated_count}件の情報を更新しました。" if updated_count > 0 else "更新するレベルが入力されませんでした。"
             await interaction.response.send_message(response_message, ephemeral=True)
         except Exception as e:
@@ -245,14 +261,10 @@ class ChecklistPaginationView(View):
         super().__init__(timeout=180)
         self.current_page = 0
         
-        self.grouped_data = {}
-        for item in all_items:
-            char_name = item.get('キャラクター名', '不明')
-            if char_name not in self.grouped_data: self.grouped_data[char_name] = []
-            self.grouped_data[char_name].append(item)
+        self.grouped_data = group_items_by_character(all_items)
         
         self.sorted_char_names = sorted(self.grouped_data.keys())
-        self.items_per_page = 10 # 1ページあたりのキャラクター数
+        self.items_per_page = CHECKLIST_ITEMS_PER_PAGE
         self.total_pages = -(-len(self.sorted_char_names) // self.items_per_page)
         
         # ボタンの初期状態を設定
@@ -314,6 +326,171 @@ class ChecklistView(View):
             return False
         return True
 
+# --- ライブボード機能 ---
+# TARGET_CHANNEL_IDにピン留めしたメッセージを、名簿の更新に合わせてその場で編集する。
+# 短時間の連続更新は1回の編集にまとめ、内容が変わったページだけを再描画する。
+LIVE_BOARD_TITLE = "共有チェックリスト（ライブボード）" # /checklistの結果と区別するための目印
+LIVE_BOARD_EDIT_INTERVAL_SECONDS = 1 # ページ編集の間隔（Discordの編集レート制限対策）
+LIVE_BOARD_MAX_RETRIES = 5 # 失敗時の再試行回数の上限（間隔は指数的に伸ばす）
+live_board_messages = None # ページ順のボードメッセージ（未読み込みならNone）
+live_board_page_cache = [] # ページごとの描画元データ（変更検知用）
+live_board_dirty = False
+live_board_first_request_at = 0.0
+live_board_last_request_at = 0.0
+live_board_task = None
+
+def mark_live_board_dirty():
+    global live_board_dirty, live_board_first_request_at, live_board_last_request_at
+    now = bot.loop.time()
+    if not live_board_dirty:
+        live_board_first_request_at = now
+    live_board_last_request_at = now
+    live_board_dirty = True
+
+def request_live_board_refresh():
+    """ライブボードの更新を予約する（連続した呼び出しは1回の更新にまとめられる）"""
+    global live_board_task
+    if not LIVE_BOARD_ENABLED or TARGET_CHANNEL_ID == 0:
+        return
+    mark_live_board_dirty()
+    if live_board_task is None or live_board_task.done():
+        live_board_task = bot.loop.create_task(live_board_worker())
+
+async def wait_for_live_board_quiet():
+    """最後の要求からLIVE_BOARD_DEBOUNCE_SECONDS経つまで待つ（最長LIVE_BOARD_MAX_WAIT_SECONDS）"""
+    while True:
+        deadline = min(
+            live_board_last_request_at + LIVE_BOARD_DEBOUNCE_SECONDS,
+            live_board_first_request_at + LIVE_BOARD_MAX_WAIT_SECONDS,
+        )
+        remaining = deadline - bot.loop.time()
+        if remaining <= 0:
+            return
+        await asyncio.sleep(remaining)
+
+async def live_board_worker():
+    global live_board_dirty
+    retries = 0
+    # 待機中・更新中に届いた要求は次の周回でまとめて反映する
+    while live_board_dirty:
+        await wait_for_live_board_quiet()
+        live_board_dirty = False
+        try:
+            succeeded = await update_live_board()
+        except Exception as e:
+            print(f"ライブボード更新中にエラーが発生: {e}")
+            succeeded = False
+        if succeeded:
+            retries = 0
+            continue
+        retries += 1
+        if retries > LIVE_BOARD_MAX_RETRIES:
+            # 再試行を打ち切り、次の更新要求を待つ
+            print(f"ライブボードの更新に{LIVE_BOARD_MAX_RETRIES}回再試行しても失敗したため中断します。")
+            retries = 0
+            continue
+        await asyncio.sleep(LIVE_BOARD_DEBOUNCE_SECONDS * 2 ** retries)
+        mark_live_board_dirty()
+
+def get_live_board_page_number(message):
+    """ボードのフッター「ページ n / m」からページ番号(n)を読み取る"""
+    footer_text = message.embeds[0].footer.text or ""
+    try:
+        return int(footer_text.split()[1])
+    except (IndexError, ValueError):
+        return None
+
+async def load_live_board_messages(channel):
+    """再起動後も同じメッセージを使えるよう、ピン留めからボードを探してページ順に並べる"""
+    pinned = await channel.pins()
+    pages = {}
+    duplicates = [] # 同じページ番号が複数ある場合、古い方は余りとして後で削除する
+    for message in sorted(pinned, key=lambda message: message.id):
+        if message.author != bot.user or not message.embeds or message.embeds[0].title != LIVE_BOARD_TITLE:
+            continue
+        page_number = get_live_board_page_number(message)
+        if page_number is None:
+            continue
+        if page_number in pages:
+            duplicates.append(pages[page_number])
+        pages[page_number] = message
+    page_count = max(pages.keys(), default=0)
+    return [pages.get(page_number) for page_number in range(1, page_count + 1)] + duplicates
+
+async def update_live_board():
+    global live_board_messages, live_board_page_cache
+    channel = bot.get_channel(TARGET_CHANNEL_ID)
+    if not channel or not spreadsheet:
+        return True
+    if live_board_messages is None:
+        live_board_messages = await load_live_board_messages(channel)
+        live_board_page_cache = [None] * len(live_board_messages)
+
+    all_items = await asyncio.to_thread(worksheet.get_all_records)
+    grouped_data = group_items_by_character(all_items)
+    sorted_char_names = sorted(grouped_data.keys())
+    total_pages = max(1, -(-len(sorted_char_names) // CHECKLIST_ITEMS_PER_PAGE))
+
+    # ページ数が増えた場合に備えて、リストの長さをページ数に揃える
+    live_board_messages += [None] * (total_pages - len(live_board_messages))
+    live_board_page_cache += [None] * (total_pages - len(live_board_page_cache))
+
+    failed = False
+    edited = False
+    for page in range(total_pages):
+        start_index = page * CHECKLIST_ITEMS_PER_PAGE
+        char_names_for_page = sorted_char_names[start_index:start_index + CHECKLIST_ITEMS_PER_PAGE]
+        data_for_page = {name: grouped_data[name] for name in char_names_for_page}
+        # ページ数も含めて比較する（フッターの表示が変わるため）
+        page_key = (total_pages, repr(data_for_page))
+        if live_board_page_cache[page] == page_key:
+            continue
+
+        embed = create_checklist_embed(data_for_page, page, total_pages)
+        embed.title = LIVE_BOARD_TITLE
+        if edited:
+            await asyncio.sleep(LIVE_BOARD_EDIT_INTERVAL_SECONDS)
+        edited = True
+        try:
+            message = live_board_messages[page]
+            if message:
+                try:
+                    await message.edit(embed=embed)
+                except discord.errors.NotFound: # ボードのメッセージが削除されていた場合は作り直す
+                    message = None
+            if not message:
+                message = await channel.send(embed=embed)
+                try:
+                    await message.pin()
+                except discord.HTTPException: # 権限不足やピン留め上限(50件)など
+                    # ピン留めされていないボードは再起動後に見つけられないため、残さずに削除する
+                    await message.delete()
+                    raise
+                live_board_messages[page] = message
+            live_board_page_cache[page] = page_key
+        except discord.HTTPException as e:
+            # 失敗したページはキャッシュを更新せず、残りのページの処理を続ける
+            print(f"ライブボードのページ {page + 1} の更新に失敗しました: {e}")
+            failed = True
+
+    # ページ数が減った場合は余ったメッセージを削除する（削除に失敗したものは次回再試行する）
+    undeleted_messages = []
+    for message in live_board_messages[total_pages:]:
+        if not message:
+            continue
+        try:
+            await message.delete()
+        except discord.errors.NotFound:
+            pass
+        except discord.HTTPException as e:
+            print(f"ライブボードの不要なページの削除に失敗しました: {e}")
+            undeleted_messages.append(message)
+            failed = True
+    live_board_messages = live_board_messages[:total_pages] + undeleted_messages
+    live_board_page_cache = live_board_page_cache[:total_pages]
+
+    return not failed # 失敗したページは呼び出し元で再試行する
+
 # --- FB時間通知機能 ---
 JST = pytz.timezone('Asia/Tokyo')
 def calculate_next_fb(base_datetime_str: str, interval_hours: int) -> datetime.datetime:
@@ -360,6 +537,8 @@ async def on_ready():
     # These lines should also be inside the on_ready function
     bot.add_view(ChecklistView())
     bot.add_view(GroupSelectionView())
+
+    request_live_board_refresh() # 起動時にライブボードを最新の状態にする
     
 class WrongChannelError(discord.CheckFailure): pass
 